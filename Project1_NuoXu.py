@@ -1,40 +1,51 @@
-import heapq
-import copy
+import itertools
 import time
-
-# -------------------------------------- Node Structure --------------------------------------
-# Represents a node in the search tree
-class PuzzleNode:
-    def __init__(self, state, parent = None, action = None, g_cost = 0, h_cost = 0):
-        self.state = state # The current puzzle configuration
-        self.parent = parent # The node that generate this node
-        self.action = action # The action that lead to this state
-        self.g_cost = g_cost # Cost from the initial state to this node
-        self.h_cost = h_cost # Estimated cost from this node to the goal
-        self.f_cost = g_cost + h_cost # Total estimated cost g + h
-
-    # Comparison for priority queue
-    # If f_costs are equal, use g_cost as a tie-breaker
-    def __lt__(self, other):
-        if self.f_cost == other.f_cost:
-            return self.g_cost < other.g_cost
-        return self.f_cost < other.f_cost
-    
-    # Equality check
-    def __eq__(self, other):
-        return isinstance(other, PuzzleNode) and self.state == other.state
-    
-# -------------------------------------- Function: Find blank tile --------------------------------------
-def find_blank(state):
-    for r in range(len(state)):
-        for c in range(len(state)):
-            if state[r][c] == 0:
-                return r, c
-    return None
-
-# -------------------------------------- Function: List-of lists state to tuple --------------------------------------
-def state_to_tuple(state):
-    return tuple(map(tuple, state))
+from collections import deque
+
+# -------------------------------------- Search Node Representation --------------------------------------
+# There is no node object: a frontier entry is a plain
+# (f_cost, g_cost, tie, state, blank) tuple, so heap comparisons stay on ints
+# (C-speed tuple compare) and a node costs one small tuple instead of a full
+# Python object. h is recoverable as f - g. Parent links live in a separate
+# came_from dict (state -> (parent_state, action)) written only when a state
+# is first reached (or reached more cheaply), which is all reconstruct_path
+# needs. The running tie counter makes every entry unique, so the compare
+# never reaches the state field.
+tie_counter = itertools.count()
+
+# -------------------------------------- State Representation --------------------------------------
+# Boards are entered/printed as flat tuples of length 9 in row-major order,
+# e.g. (1, 2, 3, 4, 5, 6, 7, 8, 0). Internally the search packs the whole board
+# into one int: each tile fits in 4 bits, so cell i occupies bits [4i, 4i+4).
+# A packed state hashes and compares as a single machine word.
+
+def encode(flat_state):
+    # Pack a flat length-9 tuple into one int (4 bits per cell)
+    v = 0
+    for i, tile in enumerate(flat_state):
+        v |= tile << (4 * i)
+    return v
+
+def decode(packed_state):
+    # Unpack an int back into a flat length-9 tuple (for printing)
+    return tuple((packed_state >> (4 * i)) & 0xF for i in range(9))
+
+# Neighbor indices of the blank for each of the 9 board positions, paired with
+# the action that moves the blank there. All the row/column arithmetic and
+# bounds checking happens here, once at import; expansion just walks the table.
+def _build_neighbors():
+    table = []
+    for blank in range(9):
+        r, c = blank // 3, blank % 3
+        entries = []
+        for change_r, change_c, action in ((-1, 0, "Up"), (1, 0, "Down"), (0, -1, "Left"), (0, 1, "Right")):
+            new_r, new_c = r + change_r, c + change_c
+            if 0 <= new_r < 3 and 0 <= new_c < 3:
+                entries.append((new_r * 3 + new_c, action))
+        table.append(tuple(entries))
+    return tuple(table)
+
+NEIGHBORS = _build_neighbors()
 
 # -------------------------------------- Heuristic Functions --------------------------------------
 # 1. Uniform Cost Search (h(n) = 0)
@@ -43,142 +54,636 @@ def no_heuristic(state, goal_state):
 
 # 2. A* with the Misplaced Tile heuristic
 def misplaced_tile_heuristic(state, goal_state):
-    # Calculate the num of misplaced tiles
+    # Calculate the num of misplaced tiles. One XOR compares all 9 cells at
+    # once (the packed-word version of an elementwise state != goal): a cell's
+    # nibble in diff is nonzero exactly when its tile is away from the goal's,
+    # and the blank is excluded by checking the state nibble
+    diff = state ^ goal_state
     misplaced_count = 0
-    for r in range(len(state)):
-        for c in range(len(state)):
-            if state[r][c] != 0 and state[r][c] != goal_state[r][c]:
-                misplaced_count += 1
+    for shift in range(0, 36, 4):
+        if (diff >> shift) & 0xF and (state >> shift) & 0xF:
+            misplaced_count += 1
     return misplaced_count
 
 # 3. A* with the Manhattan Distance heuristic.
-# Pre-compute the goal pos
-goal_pos = {}
+# Pre-compute the goal pos: a flat list indexed by tile id (0..8), so lookups
+# are C-speed list indexing instead of dict hashing
+goal_pos = []
 def precompute_goal_pos(goal_state):
     global goal_pos
-    goal_pos = {}
-    for r in range(len(goal_state)):
-        for c in range(len(goal_state)):
-            goal_pos[goal_state[r][c]] = (r, c)
-    
+    goal_pos = [None] * 9
+    for i in range(9):
+        goal_pos[(goal_state >> (4 * i)) & 0xF] = (i // 3, i % 3)
+
 def manhattan_distance_heuristic(state,goal_state):
     # Calculate the sum of manhattan distance from all tiles to their goal pos
     total_manhattan_distance = 0
-    
-    for r in range(len(goal_state)):
-        for c in range(len(goal_state)):
-            tile = state[r][c]
-            if tile != 0:
-                goal_r, goal_c = goal_pos[tile]
-                total_manhattan_distance += abs(r - goal_r) + abs(c - goal_c)
+
+    for i in range(9):
+        tile = (state >> (4 * i)) & 0xF
+        if tile != 0:
+            goal_r, goal_c = goal_pos[tile]
+            total_manhattan_distance += abs(i // 3 - goal_r) + abs(i % 3 - goal_c)
     return total_manhattan_distance
 
-# -------------------------------------- Generate Successor Nodes --------------------------------------
-def expand(node, goal_state, heuristic_func):
-    # Generates successor nodes from the current node
-    successors = []
-    state = node.state
-    blank_r, blank_c = find_blank(state)
-    moves = [(-1, 0, "Up"), (1, 0, "Down"), (0, -1, "Left"), (0, 1, "Right")]
-
-    for change_r, change_c, action in moves:
-        new_r, new_c = blank_r + change_r, blank_c + change_c
-
-        # Check if within the grid
-        if 0 <= new_r < len(state) and 0 <= new_c < len(state):
-            # Create a new state by swaping the blank tile
-            new_state = copy.deepcopy(state) # prevent to modify the original state
-            new_state[blank_r][blank_c], new_state[new_r][new_c] = new_state[new_r][new_c], new_state[blank_r][blank_c]
-
-            # Create the successor node
-            new_g_cost = node.g_cost + 1
-            new_h_cost = heuristic_func(new_state, goal_state)
-
-            successor_node = PuzzleNode(
-                state = new_state,
-                parent = node,
-                action = action,
-                h_cost = new_h_cost,
-                g_cost = new_g_cost,
-            )
-
-            successors.append(successor_node)
-    return successors
+# 4. A* with an additive 5-3 Pattern Database heuristic.
+# The tiles are split into two disjoint groups; for each group a database maps
+# every placement of that group's tiles to the minimum number of moves of
+# *those tiles only* needed to reach their goal cells (moves of the other
+# tiles and the blank are free). Because each move is counted in exactly one
+# database, the two lookups can be added and the sum stays admissible — and
+# far better informed than Manhattan distance.
+PDB_GROUPS = ((1, 2, 3, 4, 5), (6, 7, 8))
+
+# tile -> (group index, slot within the group); the blank maps to None
+PDB_SLOT = [None] * 9
+for _g, _tiles in enumerate(PDB_GROUPS):
+    for _j, _tile in enumerate(_tiles):
+        PDB_SLOT[_tile] = (_g, _j)
+
+pdb_tables = None # (db_a, db_b), built for the goal below
+pdb_goal = None
+
+def build_pdb(goal_state, tiles):
+    # Backward 0/1-BFS from the goal over the projected space: a projected
+    # state is the cells of the pattern tiles (in `tiles` order) plus the
+    # blank cell; all other tiles are indistinguishable. Swapping the blank
+    # with a pattern tile costs 1, with a don't-care tile costs 0, so a deque
+    # with appendleft for free moves settles states in cost order.
+    goal_cells = decode(goal_state)
+    start_positions = tuple(goal_cells.index(tile) for tile in tiles)
+    start_blank = goal_cells.index(0)
+
+    def pack_positions(positions):
+        key = 0
+        for i, p in enumerate(positions):
+            key |= p << (4 * i)
+        return key
+
+    INF = float("inf")
+    neighbors = NEIGHBORS
+    db = {} # packed positions (blank ignored) -> min moves of pattern tiles
+    dist = {(pack_positions(start_positions), start_blank): 0}
+    queue = deque([(0, start_positions, start_blank)])
+
+    while queue:
+        d, positions, blank = queue.popleft()
+        pos_key = pack_positions(positions)
+        if d > dist.get((pos_key, blank), INF): # stale queue entry
+            continue
+        if pos_key not in db: # settled in cost order, so first hit is the min
+            db[pos_key] = d
+
+        for n, action in neighbors[blank]:
+            if n in positions: # a pattern tile slides into the blank: costs 1
+                i = positions.index(n)
+                new_positions = positions[:i] + (blank,) + positions[i + 1:]
+                new_d = d + 1
+            else: # a don't-care tile slides: free
+                new_positions = positions
+                new_d = d
+            k = (pack_positions(new_positions), n)
+            if new_d < dist.get(k, INF):
+                dist[k] = new_d
+                if new_d == d:
+                    queue.appendleft((new_d, new_positions, n))
+                else:
+                    queue.append((new_d, new_positions, n))
+    return db
+
+def precompute_pdb(goal_state):
+    # Build both group databases once per goal (a few hundred thousand deque
+    # steps, well under a second) and reuse them across runs
+    global pdb_tables, pdb_goal
+    if pdb_goal != goal_state:
+        pdb_tables = tuple(build_pdb(goal_state, tiles) for tiles in PDB_GROUPS)
+        pdb_goal = goal_state
+
+def pdb_heuristic(state, goal_state):
+    # Sum of the two disjoint group costs: one nibble scan builds both
+    # position keys, then each database is a single dict read
+    db_a, db_b = pdb_tables
+    key_a = 0
+    key_b = 0
+    for i in range(9):
+        tile = (state >> (4 * i)) & 0xF
+        if tile != 0:
+            group, slot = PDB_SLOT[tile]
+            if group == 0:
+                key_a |= i << (4 * slot)
+            else:
+                key_b |= i << (4 * slot)
+    return db_a[key_a] + db_b[key_b]
+
+# -------------------------------------- Heuristic Cache --------------------------------------
+# Memoized h values keyed by packed state. States are re-reached via many
+# paths, and h depends only on the state, so repeats are a dict hit. Only one
+# tile moves per action, so on a miss the searches below update the parent's h
+# by an O(1) delta instead of rescanning the board.
+H_CACHE = {}
+
+# -------------------------------------- 4-ary Min-Heap --------------------------------------
+# Frontier priority queue. A 4-ary heap halves the tree depth of a binary heap,
+# so pops do fewer levels of sifting; same API shape as heapq.heappush/heappop.
+
+def heappush4(heap, item):
+    heap.append(item)
+    _siftdown4(heap, 0, len(heap) - 1)
+
+def heappop4(heap):
+    last = heap.pop()
+    if heap:
+        item = heap[0]
+        heap[0] = last
+        _siftup4(heap, 0)
+        return item
+    return last
+
+def _siftdown4(heap, startpos, pos):
+    # Bubble heap[pos] up toward the root until its parent is not larger
+    item = heap[pos]
+    while pos > startpos:
+        parentpos = (pos - 1) >> 2
+        parent = heap[parentpos]
+        if item < parent:
+            heap[pos] = parent
+            pos = parentpos
+        else:
+            break
+    heap[pos] = item
+
+def _siftup4(heap, pos):
+    # Sink heap[pos] down, swapping with its smallest child each level
+    n = len(heap)
+    item = heap[pos]
+    while True:
+        first_child = 4 * pos + 1
+        if first_child >= n:
+            break
+        smallest = first_child
+        for child in range(first_child + 1, min(first_child + 4, n)):
+            if heap[child] < heap[smallest]:
+                smallest = child
+        if heap[smallest] < item:
+            heap[pos] = heap[smallest]
+            pos = smallest
+        else:
+            break
+    heap[pos] = item
+
+# -------------------------------------- Solvability Check --------------------------------------
+def is_solvable(state):
+    # An 8-puzzle is solvable iff its tile permutation (blank dropped) has an
+    # even number of inversions: moves never change the parity, and the goal
+    # 1..8 has zero inversions. Checking up front avoids exhausting all
+    # 181,440 reachable states before reporting failure
+    tiles = [tile for tile in state if tile != 0]
+    inversions = 0
+    for i in range(len(tiles)):
+        for j in range(i + 1, len(tiles)):
+            if tiles[i] > tiles[j]:
+                inversions += 1
+    return inversions % 2 == 0
 
 # -------------------------------------- Check if it is the goal state --------------------------------------
 def goal_test(state, goal_state):
     return state == goal_state
 
 # -------------------------------------- General Search Algorithm --------------------------------------
-def general_search(initial_state, goal_state, heuristic_func):
-    # if using manhattan distance heuristic
-    if heuristic_func == manhattan_distance_heuristic:
-        precompute_goal_pos(goal_state)
+# general_search dispatches to one of three monomorphic searches, one per
+# algorithm choice. Each copy has its h update inlined into the child loop, so
+# the kernel never makes an indirect heuristic call; the UCS copy carries no h
+# machinery at all (f is just g). The loops below are the hot kernel of the
+# whole program, so each one binds globals and bound methods to locals once:
+# LOAD_FAST is far cheaper than global or attribute lookups in CPython.
+
+def general_search(initial_state, goal_state, heuristic_func, verbose=False):
+    if heuristic_func is manhattan_distance_heuristic:
+        return _search_manhattan(initial_state, goal_state, verbose)
+    if heuristic_func is misplaced_tile_heuristic:
+        return _search_misplaced(initial_state, goal_state, verbose)
+    if heuristic_func is pdb_heuristic:
+        return _search_pdb(initial_state, goal_state, verbose)
+    return _search_ucs(initial_state, goal_state, verbose)
+
+def _search_ucs(initial_state, goal_state, verbose=False):
+    # Uniform Cost Search: h is identically 0, so the heap orders on g alone
+    # and the heuristic cache and goal positions are never touched
+    initial_blank = initial_state.index(0)
+    initial_state = encode(initial_state)
+    goal_state = encode(goal_state)
+
+    # min-heap (4-ary) of (g, tie, state, blank) entries waiting to be explored
+    frontier = [(0, next(tie_counter), initial_state, initial_blank)]
+    best_g = {initial_state: 0} # cheapest g seen per state; gates pushes (lazy decrease-key)
+    came_from = {} # state -> (parent_state, action), for path reconstruction
+
+    expanded_count = 0
+    max_queue_size = 1
+
+    neighbors = NEIGHBORS
+    push = heappush4
+    pop = heappop4
+    tie = tie_counter
+    best_g_get = best_g.get
+
+    print("\nStarting Search...")
+
+    # search loop
+    while frontier:
+        if len(frontier) > max_queue_size:
+            max_queue_size = len(frontier)
+
+        # get the state with lowest g_cost
+        g_cost, _, state, blank = pop(frontier)
+
+        # goal_check
+        if goal_test(state, goal_state):
+            print("Goal state reached!")
+            return reconstruct_path(came_from, state), expanded_count, max_queue_size
+
+        # stale heap entry: a cheaper path to this state was pushed later.
+        # With a consistent heuristic this also covers the explored check:
+        # once a state is expanded its best_g is final, pushes of it stop, and
+        # every leftover entry for it has a larger g, so a non-stale pop is
+        # always a first visit
+        if g_cost > best_g_get(state, g_cost):
+            continue
+        expanded_count += 1
+
+        # print trace for every expanded node; terminal I/O dwarfs the
+        # algorithm on deep searches, so tracing is opt-in
+        if verbose:
+            print(f"The best state to expand with a g(n) = {g_cost} and h(n) = 0 is:")
+            print_state(decode(state))
+
+        # expand in place: swap the blank (nibble 0) with each neighbor tile
+        # via two XORs, then gate on explored/best_g before building the entry
+        new_g_cost = g_cost + 1
+        for neighbor, action in neighbors[blank]:
+            tile = (state >> (4 * neighbor)) & 0xF
+            new_state = state ^ (tile << (4 * neighbor)) ^ (tile << (4 * blank))
 
-    # Initialize the root node
-    initial_h = heuristic_func(initial_state, goal_state)
-    start_node = PuzzleNode(state=initial_state, g_cost=0, h_cost=initial_h)
+            old_g = best_g_get(new_state)
+            if old_g is not None and new_g_cost >= old_g:
+                continue
 
-    frontier = [start_node] # nodes waiting to be explored
-    heapq.heapify(frontier) # transform the list into min-heap based on f_cost
-    explored = set() # store tuples of states visited
+            best_g[new_state] = new_g_cost
+            came_from[new_state] = (state, action)
+            push(frontier, (new_g_cost, next(tie), new_state, neighbor))
+
+    print("Search failed. Frontier is empty.")
+    return None, expanded_count, max_queue_size
+
+def _search_misplaced(initial_state, goal_state, verbose=False):
+    # A* with the Misplaced Tile heuristic, delta update inlined: the moved
+    # tile slides neighbor -> blank, so h changes by whether it left or
+    # entered its goal cell
+    initial_blank = initial_state.index(0)
+    initial_state = encode(initial_state)
+    goal_state = encode(goal_state)
+
+    precompute_goal_pos(goal_state)
+    H_CACHE.clear() # cached h values from a previous run are stale
+
+    initial_h = misplaced_tile_heuristic(initial_state, goal_state)
+
+    # min-heap (4-ary) of (f, g, tie, state, blank) entries waiting to be explored
+    frontier = [(initial_h, 0, next(tie_counter), initial_state, initial_blank)]
+    best_g = {initial_state: 0} # cheapest g seen per state; gates pushes (lazy decrease-key)
+    came_from = {} # state -> (parent_state, action), for path reconstruction
 
     expanded_count = 0
     max_queue_size = 1
 
+    neighbors = NEIGHBORS
+    h_cache = H_CACHE
+    pos = goal_pos
+    push = heappush4
+    pop = heappop4
+    tie = tie_counter
+    best_g_get = best_g.get
+
     print("\nStarting Search...")
-    
+
     # search loop
     while frontier:
-        max_queue_size = max(max_queue_size, len(frontier))
+        if len(frontier) > max_queue_size:
+            max_queue_size = len(frontier)
 
         # get the state with lowest f_cost
-        current_node = heapq.heappop(frontier)
+        f_cost, g_cost, _, state, blank = pop(frontier)
 
         # goal_check
-        if goal_test(current_node.state, goal_state):
+        if goal_test(state, goal_state):
             print("Goal state reached!")
-            return current_node, expanded_count, max_queue_size
-
-        # add to explored state
-        # convert state to tuple for hashing before adding to set
-        current_state_tuple = state_to_tuple(current_node.state)
-        if current_state_tuple in explored: # if it is explored
+            return reconstruct_path(came_from, state), expanded_count, max_queue_size
+
+        # stale heap entry: a cheaper path to this state was pushed later.
+        # With a consistent heuristic this also covers the explored check:
+        # once a state is expanded its best_g is final, pushes of it stop, and
+        # every leftover entry for it has a larger g, so a non-stale pop is
+        # always a first visit
+        if g_cost > best_g_get(state, g_cost):
             continue
+        expanded_count += 1
+
+        # print trace for every expanded node; terminal I/O dwarfs the
+        # algorithm on deep searches, so tracing is opt-in
+        h_cost = f_cost - g_cost
+        if verbose:
+            print(f"The best state to expand with a g(n) = {g_cost} and h(n) = {h_cost} is:")
+            print_state(decode(state))
+
+        # expand in place: swap the blank (nibble 0) with each neighbor tile
+        # via two XORs, then gate on explored/best_g before building the entry
+        new_g_cost = g_cost + 1
+        for neighbor, action in neighbors[blank]:
+            tile = (state >> (4 * neighbor)) & 0xF
+            new_state = state ^ (tile << (4 * neighbor)) ^ (tile << (4 * blank))
+
+            old_g = best_g_get(new_state)
+            if old_g is not None and new_g_cost >= old_g:
+                continue
+
+            # incremental misplaced count, memoized by state
+            new_h_cost = h_cache.get(new_state)
+            if new_h_cost is None:
+                goal_rc = pos[tile]
+                new_h_cost = (h_cost
+                              + ((blank // 3, blank % 3) != goal_rc)
+                              - ((neighbor // 3, neighbor % 3) != goal_rc))
+                h_cache[new_state] = new_h_cost
+
+            best_g[new_state] = new_g_cost
+            came_from[new_state] = (state, action)
+            push(frontier, (new_g_cost + new_h_cost, new_g_cost, next(tie), new_state, neighbor))
+
+    print("Search failed. Frontier is empty.")
+    return None, expanded_count, max_queue_size
+
+def _search_manhattan(initial_state, goal_state, verbose=False):
+    # A* with the Manhattan Distance heuristic, delta update inlined: the
+    # moved tile slides neighbor -> blank, so h changes by the difference of
+    # that one tile's distances to its goal cell
+    initial_blank = initial_state.index(0)
+    initial_state = encode(initial_state)
+    goal_state = encode(goal_state)
+
+    precompute_goal_pos(goal_state)
+    H_CACHE.clear() # cached h values from a previous run are stale
+
+    initial_h = manhattan_distance_heuristic(initial_state, goal_state)
+
+    # min-heap (4-ary) of (f, g, tie, state, blank) entries waiting to be explored
+    frontier = [(initial_h, 0, next(tie_counter), initial_state, initial_blank)]
+    best_g = {initial_state: 0} # cheapest g seen per state; gates pushes (lazy decrease-key)
+    came_from = {} # state -> (parent_state, action), for path reconstruction
+
+    expanded_count = 0
+    max_queue_size = 1
+
+    neighbors = NEIGHBORS
+    h_cache = H_CACHE
+    pos = goal_pos
+    push = heappush4
+    pop = heappop4
+    tie = tie_counter
+    best_g_get = best_g.get
+
+    print("\nStarting Search...")
+
+    # search loop
+    while frontier:
+        if len(frontier) > max_queue_size:
+            max_queue_size = len(frontier)
+
+        # get the state with lowest f_cost
+        f_cost, g_cost, _, state, blank = pop(frontier)
 
-        explored.add(current_state_tuple)
+        # goal_check
+        if goal_test(state, goal_state):
+            print("Goal state reached!")
+            return reconstruct_path(came_from, state), expanded_count, max_queue_size
+
+        # stale heap entry: a cheaper path to this state was pushed later.
+        # With a consistent heuristic this also covers the explored check:
+        # once a state is expanded its best_g is final, pushes of it stop, and
+        # every leftover entry for it has a larger g, so a non-stale pop is
+        # always a first visit
+        if g_cost > best_g_get(state, g_cost):
+            continue
         expanded_count += 1
 
-        # print trace for every expanded node
-        print(f"The best state to expand with a g(n) = {current_node.g_cost} and h(n) = {current_node.h_cost} is:")
-        print_state(current_node.state)
+        # print trace for every expanded node; terminal I/O dwarfs the
+        # algorithm on deep searches, so tracing is opt-in
+        h_cost = f_cost - g_cost
+        if verbose:
+            print(f"The best state to expand with a g(n) = {g_cost} and h(n) = {h_cost} is:")
+            print_state(decode(state))
+
+        # expand in place: swap the blank (nibble 0) with each neighbor tile
+        # via two XORs, then gate on explored/best_g before building the entry
+        new_g_cost = g_cost + 1
+        for neighbor, action in neighbors[blank]:
+            tile = (state >> (4 * neighbor)) & 0xF
+            new_state = state ^ (tile << (4 * neighbor)) ^ (tile << (4 * blank))
+
+            old_g = best_g_get(new_state)
+            if old_g is not None and new_g_cost >= old_g:
+                continue
+
+            # incremental Manhattan distance, memoized by state
+            new_h_cost = h_cache.get(new_state)
+            if new_h_cost is None:
+                goal_r, goal_c = pos[tile]
+                new_h_cost = (h_cost
+                              + abs(blank // 3 - goal_r) + abs(blank % 3 - goal_c)
+                              - abs(neighbor // 3 - goal_r) - abs(neighbor % 3 - goal_c))
+                h_cache[new_state] = new_h_cost
+
+            best_g[new_state] = new_g_cost
+            came_from[new_state] = (state, action)
+            push(frontier, (new_g_cost + new_h_cost, new_g_cost, next(tie), new_state, neighbor))
+
+    print("Search failed. Frontier is empty.")
+    return None, expanded_count, max_queue_size
+
+def _search_pdb(initial_state, goal_state, verbose=False):
+    # A* with the additive pattern database heuristic. No O(1) delta exists
+    # here (a database value depends on the whole group placement), so every
+    # new state pays one nibble scan plus two dict reads — still cheaper than
+    # a Manhattan rescan, and far better informed — with repeats served from
+    # the heuristic cache.
+    initial_blank = initial_state.index(0)
+    initial_state = encode(initial_state)
+    goal_state = encode(goal_state)
+
+    precompute_pdb(goal_state)
+    H_CACHE.clear() # cached h values from a previous run are stale
 
-        # expand the node
-        successors = expand(current_node, goal_state, heuristic_func)
+    initial_h = pdb_heuristic(initial_state, goal_state)
 
-        # add successors into frontier
-        for child_node in successors:
-            child_state_tuple = state_to_tuple(child_node.state)
-            if child_state_tuple not in explored:
-                heapq.heappush(frontier, child_node)
+    # min-heap (4-ary) of (f, g, tie, state, blank) entries waiting to be explored
+    frontier = [(initial_h, 0, next(tie_counter), initial_state, initial_blank)]
+    best_g = {initial_state: 0} # cheapest g seen per state; gates pushes (lazy decrease-key)
+    came_from = {} # state -> (parent_state, action), for path reconstruction
+
+    expanded_count = 0
+    max_queue_size = 1
+
+    neighbors = NEIGHBORS
+    h_cache = H_CACHE
+    lookup_h = pdb_heuristic
+    push = heappush4
+    pop = heappop4
+    tie = tie_counter
+    best_g_get = best_g.get
+
+    print("\nStarting Search...")
+
+    # search loop
+    while frontier:
+        if len(frontier) > max_queue_size:
+            max_queue_size = len(frontier)
+
+        # get the state with lowest f_cost
+        f_cost, g_cost, _, state, blank = pop(frontier)
+
+        # goal_check
+        if goal_test(state, goal_state):
+            print("Goal state reached!")
+            return reconstruct_path(came_from, state), expanded_count, max_queue_size
+
+        # stale heap entry: a cheaper path to this state was pushed later.
+        # With a consistent heuristic this also covers the explored check:
+        # once a state is expanded its best_g is final, pushes of it stop, and
+        # every leftover entry for it has a larger g, so a non-stale pop is
+        # always a first visit
+        if g_cost > best_g_get(state, g_cost):
+            continue
+        expanded_count += 1
+
+        # print trace for every expanded node; terminal I/O dwarfs the
+        # algorithm on deep searches, so tracing is opt-in
+        if verbose:
+            h_cost = f_cost - g_cost
+            print(f"The best state to expand with a g(n) = {g_cost} and h(n) = {h_cost} is:")
+            print_state(decode(state))
+
+        # expand in place: swap the blank (nibble 0) with each neighbor tile
+        # via two XORs, then gate on explored/best_g before building the entry
+        new_g_cost = g_cost + 1
+        for neighbor, action in neighbors[blank]:
+            tile = (state >> (4 * neighbor)) & 0xF
+            new_state = state ^ (tile << (4 * neighbor)) ^ (tile << (4 * blank))
+
+            old_g = best_g_get(new_state)
+            if old_g is not None and new_g_cost >= old_g:
+                continue
+
+            # database lookup, memoized by state
+            new_h_cost = h_cache.get(new_state)
+            if new_h_cost is None:
+                new_h_cost = lookup_h(new_state, goal_state)
+                h_cache[new_state] = new_h_cost
+
+            best_g[new_state] = new_g_cost
+            came_from[new_state] = (state, action)
+            push(frontier, (new_g_cost + new_h_cost, new_g_cost, next(tie), new_state, neighbor))
 
     print("Search failed. Frontier is empty.")
     return None, expanded_count, max_queue_size
 
+# -------------------------------------- Iterative Deepening A* --------------------------------------
+def ida_star(initial_state, goal_state, verbose=False):
+    # IDA* with the Manhattan Distance heuristic: depth-first search bounded
+    # by f = g + h, restarted with the smallest f that exceeded the bound.
+    # Memory is O(solution depth) — no frontier, no explored set, no heap.
+    initial_blank = initial_state.index(0)
+    initial_state = encode(initial_state)
+    goal_state = encode(goal_state)
+
+    precompute_goal_pos(goal_state)
+    root_h = manhattan_distance_heuristic(initial_state, goal_state)
+
+    neighbors = NEIGHBORS
+    pos = goal_pos
+    INF = float("inf")
+
+    path = [initial_state] # states on the current DFS path (the only memory kept)
+    on_path = {initial_state} # same states as a set, to prune cycles
+    expanded_count = 0
+    max_stack_size = 1
+
+    def dfs(state, blank, g, h, bound):
+        nonlocal expanded_count, max_stack_size
+        if g + h > bound:
+            return g + h # prune; candidate for the next bound
+        if state == goal_state:
+            return True
+
+        expanded_count += 1
+        if len(path) > max_stack_size:
+            max_stack_size = len(path)
+        if verbose:
+            print(f"The best state to expand with a g(n) = {g} and h(n) = {h} is:")
+            print_state(decode(state))
+
+        next_bound = INF
+        for neighbor, action in neighbors[blank]:
+            tile = (state >> (4 * neighbor)) & 0xF
+            new_state = state ^ (tile << (4 * neighbor)) ^ (tile << (4 * blank))
+            if new_state in on_path: # never walk back onto the current path
+                continue
+
+            # incremental Manhattan update: the moved tile slides neighbor -> blank
+            goal_r, goal_c = pos[tile]
+            new_h = (h
+                     + abs(blank // 3 - goal_r) + abs(blank % 3 - goal_c)
+                     - abs(neighbor // 3 - goal_r) - abs(neighbor % 3 - goal_c))
+
+            path.append(new_state)
+            on_path.add(new_state)
+            result = dfs(new_state, neighbor, g + 1, new_h, bound)
+            if result is True: # leave the solution path in place
+                return True
+            if result < next_bound:
+                next_bound = result
+            path.pop()
+            on_path.discard(new_state)
+        return next_bound
+
+    print("\nStarting Search...")
+
+    bound = root_h
+    while True:
+        result = dfs(initial_state, initial_blank, 0, root_h, bound)
+        if result is True:
+            print("Goal state reached!")
+            return [decode(s) for s in path], expanded_count, max_stack_size
+        if result == INF: # no state left under any bound
+            print("Search failed. No solution under any bound.")
+            return None, expanded_count, max_stack_size
+        bound = result # deepen to the smallest f that was pruned
+
 # -------------------------------------- Reconstrcut Path --------------------------------------
-def reconstruct_path(goal_node):
-    #Traces back from the goal node to the start node
+def reconstruct_path(came_from, goal_key):
+    #Traces back from the goal key to the start via the came_from links
     path = []
-    current = goal_node
-    while current is not None:
-        path.append(current.state)
-        current = current.parent
+    key = goal_key
+    while True:
+        path.append(decode(key))
+        link = came_from.get(key)
+        if link is None: # the start state has no parent link
+            break
+        key = link[0]
     return path[::-1]
 
 # -------------------------------------- Print State --------------------------------------
 def print_state(state):
-    for row in state:
-        print(row)
+    for r in range(3):
+        print(list(state[3 * r: 3 * r + 3]))
 
 # -------------------------------------- User Interface --------------------------------------
 def get_user_puzzle():
@@ -206,43 +711,43 @@ def get_user_puzzle():
                 print(f"An unexpected error occurred: {e}")
 
     # check 0-8 appears exactly once
-    flat_puzzle = [item for sublist in puzzle for item in sublist]
+    flat_puzzle = tuple(item for sublist in puzzle for item in sublist)
     if sorted(flat_puzzle) != list(range(9)):
         print("\nError: Invalid puzzle configuration.")
         print("The puzzle must contain each number from 0 to 8 exactly once.")
         print("Your input:")
-        print_state(puzzle)
+        print_state(flat_puzzle)
         return None
-    
-    return puzzle
+
+    return flat_puzzle
 
 # -------------------------------------- Main --------------------------------------
 if __name__ == "__main__":
-    # goal state
-    GOAL_STATE_8_PUZZLE = [[1, 2, 3],
-                           [4, 5, 6],
-                           [7, 8, 0]]
-    
+    # goal state (flat, row-major)
+    GOAL_STATE_8_PUZZLE = (1, 2, 3,
+                           4, 5, 6,
+                           7, 8, 0)
+
     initial_state = None
     print("Welcome to my 8-Puzzle Solver.")
     choice = input("Type '1' to use a default puzzle, or '2' to create your own: ").strip()
     if choice == '1':
         # depth = 2
-        # initial_state = [[1, 2, 3],
-        #                  [4, 0, 6],
-        #                  [7, 5, 8]]
+        # initial_state = (1, 2, 3,
+        #                  4, 0, 6,
+        #                  7, 5, 8)
         # depth = 4
-        # initial_state = [[1, 2, 3],
-        #                  [5, 0, 6],
-        #                  [4, 7, 8]]
+        # initial_state = (1, 2, 3,
+        #                  5, 0, 6,
+        #                  4, 7, 8)
         # depth = 8
-        # initial_state = [[1, 3, 6],
-        #                  [5, 0, 2],
-        #                  [4, 7, 8]]       
+        # initial_state = (1, 3, 6,
+        #                  5, 0, 2,
+        #                  4, 7, 8)
         # depth = 16
-        initial_state = [[1, 6, 7],
-                         [5, 0, 3],
-                         [4, 8, 2]]
+        initial_state = (1, 6, 7,
+                         5, 0, 3,
+                         4, 8, 2)
         print("\nUsing default puzzle:")
         print_state(initial_state)
     elif choice == '2':
@@ -255,12 +760,20 @@ if __name__ == "__main__":
         print("Invalid choice. Exiting.")
         exit()
 
+    # Half of all configurations can never reach the goal; bail out before
+    # the search instead of exhausting the state space
+    if not is_solvable(initial_state):
+        print("\nThis puzzle is unsolvable (odd inversion parity). Exiting.")
+        exit()
+
     # Select Algorithm
     print("\nSelect algorithm:")
     print("(1) Uniform Cost Search")
     print("(2) A* with Misplaced Tile Heuristic")
     print("(3) A* with Manhattan Distance Heuristic")
-    algo_choice = input("Enter choice (1, 2, or 3): ").strip()
+    print("(4) IDA* with Manhattan Distance Heuristic")
+    print("(5) A* with Pattern Database Heuristic")
+    algo_choice = input("Enter choice (1-5): ").strip()
 
     heuristic = None
     algo_name = ""
@@ -273,28 +786,39 @@ if __name__ == "__main__":
     elif algo_choice == '3':
         heuristic = manhattan_distance_heuristic
         algo_name = "A* with Manhattan Distance Heuristic"
+    elif algo_choice == '4':
+        algo_name = "IDA* with Manhattan Distance Heuristic"
+    elif algo_choice == '5':
+        heuristic = pdb_heuristic
+        algo_name = "A* with Pattern Database Heuristic"
     else:
         print("Invalid algorithm choice. Exiting.")
         exit()
 
+    # Tracing every expansion is handy for small puzzles but the I/O dominates
+    # the runtime on deep ones, so it is off unless asked for
+    verbose = input("Print every expanded state? (y/N): ").strip().lower() == 'y'
+
     print(f"\nRunning {algo_name}...")
 
     start_time = time.time()
-    solution_node, nodes_expanded, max_q_size = general_search(initial_state, GOAL_STATE_8_PUZZLE, heuristic)
+    if algo_choice == '4':
+        solution_path, nodes_expanded, max_q_size = ida_star(initial_state, GOAL_STATE_8_PUZZLE, verbose)
+    else:
+        solution_path, nodes_expanded, max_q_size = general_search(initial_state, GOAL_STATE_8_PUZZLE, heuristic, verbose)
     end_time = time.time()
 
     # Print Results
     print("\n--- Search Results ---")
     #print(f"Algorithm: {algo_name}")
 
-    if solution_node:       
+    if solution_path:
         print("Solution Found!")
-        print(f"Solution depth was: {solution_node.g_cost}") # g_cost is the depth
-        #path = reconstruct_path(solution_node)
+        print(f"Solution depth was: {len(solution_path) - 1}") # number of moves is the depth
         #print("Initial State:")
-        #print_state(path[0])
+        #print_state(solution_path[0])
         #print("Goal State:")
-        #print_state(path[-1])
+        #print_state(solution_path[-1])
 
     else:
         print("No solution found.")